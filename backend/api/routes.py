@@ -2,43 +2,155 @@
 
 from __future__ import annotations
 
-import json
-import math
+import functools
+import hashlib
+import itertools
 import random
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Iterator
 
+import numpy as np
+import orjson
 import pandas as pd
-from flask import Response, current_app, jsonify, request, stream_with_context
-from pydantic import ValidationError
+from cachetools import LRUCache, TTLCache
+from flask import Response, current_app, request, stream_with_context
+from pydantic import TypeAdapter, ValidationError
 
 from backend.models.requests import AnalysisRequest, ConnectionRequest
-from backend.models.responses import AnalysisResponse
 from backend.services import (
     AnalyticsService,
     DataPipelineService,
     DatabaseService,
     registry,
 )
-from backend.utils import build_connection_url
+from backend.utils import build_connection_url, isoformat_values
 
 from . import api_bp
 
+STREAM_BATCH_SIZE = 10_000
+LIVE_BUFFER_SIZE = 1024
+
+# Built once at import so each request goes straight to the compiled validators.
+_ANALYSIS_ADAPTER = TypeAdapter(AnalysisRequest)
+_CONNECTION_ADAPTER = TypeAdapter(ConnectionRequest)
+
+# In-flight connection checks keyed by database URL, shared by concurrent /connect calls.
+_pending_validations: dict[str, Future] = {}
+_pending_lock = threading.Lock()
+
+# Recent /analyze response bodies keyed by a hash of the request payload.
+_ANALYZE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=60)
+_analyze_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_cached(connection_id: str, registry_version: int) -> str | None:
+    """Memoize registry lookups; the version key drops stale entries after any registry change."""
+    return registry.resolve(connection_id)
+
 
 def _resolve_database_url(connection_id: str) -> str | None:
-    database_url = registry.resolve(connection_id)
+    database_url = _resolve_cached(connection_id, registry.version)
     if not database_url:
         current_app.logger.error("Unknown connection id requested: %s", connection_id)
     return database_url
 
 
+class _ServiceCache(LRUCache):
+    """LRU of DatabaseService per URL that disposes the engine of each evicted service."""
+
+    def popitem(self) -> tuple[str, DatabaseService]:
+        database_url, service = super().popitem()
+        service.dispose()
+        return database_url, service
+
+
+# One DatabaseService (and its engine pool) per validated database URL, shared across requests.
+_SERVICES = _ServiceCache(maxsize=64)
+_services_lock = threading.Lock()
+
+
+def _get_service(database_url: str, service: DatabaseService | None = None) -> DatabaseService:
+    """Return the shared service for ``database_url``, caching ``service`` if there is none yet."""
+    with _services_lock:
+        cached = _SERVICES.get(database_url)
+        if cached is None:
+            cached = service or DatabaseService(database_url)
+            _SERVICES[database_url] = cached
+    if service is not None and service is not cached:
+        service.dispose()
+    return cached
+
+
+def _validate_once(database_url: str) -> bool:
+    """Validate a connection, coalescing concurrent checks for the same URL into one ping.
+
+    Only services that pass validation are kept in ``_SERVICES``; a failed check disposes
+    its engine so mistyped credentials do not hold pool slots.
+    """
+    with _pending_lock:
+        future = _pending_validations.get(database_url)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _pending_validations[database_url] = future
+
+    if is_owner:
+        service = DatabaseService(database_url)
+        try:
+            valid = service.validate_connection()
+        except Exception as exc:  # pylint: disable=broad-except
+            service.dispose()
+            future.set_exception(exc)
+        else:
+            _get_service(database_url, service)
+            future.set_result(valid)
+        finally:
+            with _pending_lock:
+                _pending_validations.pop(database_url, None)
+
+    return future.result()
+
+
+def _json_response(payload: dict[str, Any], status: int = 200) -> Response:
+    """Serialize ``payload`` with orjson, which also handles NumPy scalars and arrays natively."""
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _validation_error(exc: ValidationError) -> Response:
+    errors = exc.errors()
+    for error in errors:
+        # Malformed bodies are echoed back as the raw request bytes, which may not be UTF-8.
+        if isinstance(error.get("input"), bytes):
+            error["input"] = error["input"].decode("utf-8", errors="replace")
+    return _json_response({"status": "error", "errors": errors}, 400)
+
+
+def _historical_batches(
+    dates: np.ndarray,
+    values: np.ndarray,
+    batch_size: int,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield historical points in batches so large series never sit in memory as dicts at once."""
+    for start in range(0, len(values), batch_size):
+        stop = start + batch_size
+        yield [
+            {"date": date, "value": value}
+            for date, value in zip(dates[start:stop].tolist(), values[start:stop].tolist())
+        ]
+
+
 @api_bp.route("/connect", methods=["POST"])
 def connect_database():
     """Validate database credentials and return a connection token."""
-    payload = request.get_json(silent=True) or {}
     try:
-        data = ConnectionRequest.model_validate(payload)
+        data = _CONNECTION_ADAPTER.validate_json(request.get_data(cache=False) or b"{}")
     except ValidationError as exc:
-        return jsonify(status="error", errors=exc.errors()), 400
+        return _validation_error(exc)
 
     database_url = data.engine_url or build_connection_url(
         driver=data.driver,
@@ -50,15 +162,14 @@ def connect_database():
         options=data.options,
     )
 
-    service = DatabaseService(database_url)
     try:
-        service.validate_connection()
+        _validate_once(database_url)
     except Exception as exc:  # pylint: disable=broad-except
         current_app.logger.exception("Database connection failed")
-        return jsonify(status="error", message="Unable to connect to database", detail=str(exc)), 400
+        return _json_response({"status": "error", "message": "Unable to connect to database", "detail": str(exc)}, 400)
 
     token = registry.register(database_url)
-    return jsonify(status="success", connection_id=token), 200
+    return _json_response({"status": "success", "connection_id": token}, 200)
 
 
 @api_bp.route("/tables", methods=["GET"])
@@ -66,54 +177,69 @@ def list_tables():
     """Return the tables available for a given connection id."""
     connection_id = request.args.get("connection_id")
     if not connection_id:
-        return jsonify(status="error", message="connection_id is required"), 400
+        return _json_response({"status": "error", "message": "connection_id is required"}, 400)
 
     database_url = _resolve_database_url(connection_id)
     if not database_url:
-        return jsonify(status="error", message="Unknown connection_id"), 404
+        return _json_response({"status": "error", "message": "Unknown connection_id"}, 404)
 
-    service = DatabaseService(database_url)
+    service = _get_service(database_url)
     try:
         tables = service.list_tables()
     except Exception as exc:  # pylint: disable=broad-except
         current_app.logger.exception("Failed to list tables")
-        return jsonify(status="error", message="Unable to list tables", detail=str(exc)), 500
+        return _json_response({"status": "error", "message": "Unable to list tables", "detail": str(exc)}, 500)
 
-    return jsonify(status="success", tables=tables), 200
+    return _json_response({"status": "success", "tables": tables}, 200)
 
 
 @api_bp.route("/analyze", methods=["POST"])
 def analyze_data():
-    """Clean data, detect anomalies, and forecast trends for a selected table."""
-    payload = request.get_json(silent=True) or {}
+    """Clean data, detect anomalies, and forecast trends for a selected table.
+
+    Pass ``?stream=1`` to receive the results as newline-delimited JSON batches
+    instead of a single envelope. Non-streamed responses are cached briefly by
+    request payload; the ``X-Cache`` header reports ``HIT`` or ``MISS``.
+    """
+    body = request.get_data(cache=False) or b"{}"
+    stream = request.args.get("stream") == "1"
+    cache_key = hashlib.blake2b(body, digest_size=16).digest()
+    if not stream:
+        with _analyze_cache_lock:
+            cached_body = _ANALYZE_CACHE.get(cache_key)
+        if cached_body is not None:
+            return Response(cached_body, status=200, mimetype="application/json", headers={"X-Cache": "HIT"})
+
     try:
-        data = AnalysisRequest.model_validate(payload)
+        data = _ANALYSIS_ADAPTER.validate_json(body)
     except ValidationError as exc:
-        return jsonify(status="error", errors=exc.errors()), 400
+        return _validation_error(exc)
 
     database_url = _resolve_database_url(data.connection_id)
     if not database_url:
-        return jsonify(status="error", message="Unknown connection_id"), 404
+        return _json_response({"status": "error", "message": "Unknown connection_id"}, 404)
 
-    database_service = DatabaseService(database_url)
+    database_service = _get_service(database_url)
     rows_limit = data.limit
     if data.max_rows:
         rows_limit = min(rows_limit, data.max_rows)
 
     try:
-        raw_frame = database_service.fetch_table(data.table, limit=rows_limit)
+        raw_frame = database_service.fetch_table(
+            data.table,
+            limit=rows_limit,
+            order_by=data.date_column,
+            dtype_backend="pyarrow" if current_app.config["APP_CONFIG"].ARROW_DTYPE_BACKEND else None,
+        )
     except Exception as exc:  # pylint: disable=broad-except
         current_app.logger.exception("Failed to fetch table data")
-        return jsonify(status="error", message="Unable to fetch table data", detail=str(exc)), 500
+        return _json_response({"status": "error", "message": "Unable to fetch table data", "detail": str(exc)}, 500)
 
     missing_columns = [col for col in [data.target_column, data.date_column] if col and col not in raw_frame.columns]
     if missing_columns:
-        return jsonify(status="error", message="Missing columns in dataset", missing_columns=missing_columns), 400
+        return _json_response({"status": "error", "message": "Missing columns in dataset", "missing_columns": missing_columns}, 400)
 
     pipeline = DataPipelineService()
-    cleaned_frame = pipeline.clean(raw_frame)
-    normalized_frame = pipeline.normalize(cleaned_frame)
-
     analytics = AnalyticsService(
         anomaly_threshold=data.anomaly_threshold,
         forecast_periods=data.forecast_periods,
@@ -121,51 +247,81 @@ def analyze_data():
         forecast_method=data.forecast_method,
         max_samples=data.max_rows,
     )
-    anomalies = analytics.detect_anomalies(
-        cleaned_frame,
-        data.target_column,
-        data.date_column,
-        features=normalized_frame,
-    )
-    forecast_points = analytics.forecast(cleaned_frame, data.target_column, data.date_column)
-
-    if data.date_column and data.date_column in cleaned_frame.columns:
-        historical_frame = cleaned_frame[[data.date_column, data.target_column]].copy()
-        historical_frame[data.date_column] = pd.to_datetime(historical_frame[data.date_column], errors="coerce")
-        historical_frame = historical_frame.dropna(subset=[data.date_column])
-        historical_frame = historical_frame.sort_values(by=data.date_column)
-        historical_series = [
-            {
-                "date": row[data.date_column].isoformat(),
-                "value": float(row[data.target_column]),
-            }
-            for _, row in historical_frame.iterrows()
-        ]
-    else:
-        historical_series = [
-            {
-                "date": str(index),
-                "value": float(value),
-            }
-            for index, value in cleaned_frame[data.target_column].items()
-        ]
+    cleaned_frame = pipeline.clean(raw_frame)
+    has_date_column = bool(data.date_column) and data.date_column in cleaned_frame.columns
+    if has_date_column:
+        # Parse once here so the forecast and historical series reuse the datetime64 column.
+        cleaned_frame[data.date_column] = pd.to_datetime(cleaned_frame[data.date_column], errors="coerce", cache=True)
+    # Only feature-based detectors read the normalized frame; z-score uses the target column alone.
+    needs_features = data.anomaly_method in AnalyticsService.FEATURE_ANOMALY_METHODS
+    normalized_frame = pipeline.normalize(cleaned_frame) if needs_features else None
+
+    # Detection and forecasting only read the cleaned frame, so they run side by side on a
+    # pool owned by this request while the historical series is built here.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        anomalies_future = executor.submit(
+            analytics.detect_anomalies,
+            cleaned_frame,
+            data.target_column,
+            data.date_column,
+            features=normalized_frame,
+        )
+        forecast_future = executor.submit(analytics.forecast, cleaned_frame, data.target_column, data.date_column)
+
+        if has_date_column:
+            historical_frame = cleaned_frame[[data.date_column, data.target_column]].dropna(subset=[data.date_column])
+            # Rows arrive ordered by the date column; only sort if parsing changed the order.
+            if not historical_frame[data.date_column].is_monotonic_increasing:
+                historical_frame = historical_frame.sort_values(by=data.date_column)
+            historical_dates = isoformat_values(historical_frame[data.date_column])
+            historical_values = historical_frame[data.target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            historical_dates = cleaned_frame.index.astype(str).to_numpy()
+            historical_values = cleaned_frame[data.target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        anomalies = anomalies_future.result()
+        forecast_points = forecast_future.result()
+
+    metrics = {
+        "rows_processed": int(len(cleaned_frame)),
+        "anomalies_detected": len(anomalies),
+        "forecast_horizon": len(forecast_points),
+        "anomaly_method": data.anomaly_method,
+        "forecast_method": data.forecast_method,
+        "target_column": data.target_column,
+    }
+
+    if stream:
+
+        def ndjson_stream():
+            yield orjson.dumps({"type": "meta", "metrics": metrics, "pipeline_steps": pipeline.summary()}) + b"\n"
+            for batch in _historical_batches(historical_dates, historical_values, STREAM_BATCH_SIZE):
+                yield orjson.dumps({"type": "historical", "batch": batch}) + b"\n"
+            for start in range(0, len(anomalies), STREAM_BATCH_SIZE):
+                yield orjson.dumps({"type": "anomalies", "batch": anomalies[start:start + STREAM_BATCH_SIZE]}) + b"\n"
+            yield orjson.dumps({"type": "forecast", "batch": forecast_points}) + b"\n"
 
-    response_model = AnalysisResponse(
-        anomalies=anomalies,
-        forecast=forecast_points,
-        historical=historical_series,
-        metrics={
-            "rows_processed": int(len(cleaned_frame)),
-            "anomalies_detected": len(anomalies),
-            "forecast_horizon": len(forecast_points),
-            "anomaly_method": data.anomaly_method,
-            "forecast_method": data.forecast_method,
-            "target_column": data.target_column,
+        return Response(stream_with_context(ndjson_stream()), mimetype="application/x-ndjson")
+
+    historical_series = list(
+        itertools.chain.from_iterable(_historical_batches(historical_dates, historical_values, STREAM_BATCH_SIZE))
+    )
+    # Results are produced internally, so skip re-validating them through AnalysisResponse.
+    response = _json_response(
+        {
+            "status": "success",
+            "anomalies": anomalies,
+            "forecast": forecast_points,
+            "historical": historical_series,
+            "metrics": metrics,
+            "pipeline_steps": pipeline.summary(),
         },
-        pipeline_steps=pipeline.summary(),
+        200,
     )
-
-    return jsonify(status="success", **response_model.model_dump()), 200
+    with _analyze_cache_lock:
+        _ANALYZE_CACHE[cache_key] = response.get_data()
+    response.headers["X-Cache"] = "MISS"
+    return response
 
 
 @api_bp.route("/stream/live", methods=["GET"])
@@ -175,28 +331,47 @@ def stream_live_metric():
     def event_stream():
         amplitude = 12
         baseline = 120
-        t = random.randint(0, 500)
+        rng = random.Random()
+        np_rng = np.random.default_rng()
+        # Bind per-tick callables once; every connected client runs this loop.
+        _random = rng.random
+        _uniform = rng.uniform
+        _choice = rng.choice
+        _now = datetime.now
+        _dumps = orjson.dumps
+        _sleep = time.sleep
+        utc = timezone.utc
+        t = rng.randint(0, 500)
+        # Seasonal and noise terms are drawn in NumPy batches and consumed one per tick.
+        seasonal_buffer: list[float] = []
+        noise_buffer: list[float] = []
+        i = LIVE_BUFFER_SIZE
         while True:
-            seasonal = amplitude * math.sin(t / 12)
-            noise = random.gauss(0, 2.5)
+            if i == LIVE_BUFFER_SIZE:
+                seasonal_buffer = (amplitude * np.sin(np.arange(t, t + LIVE_BUFFER_SIZE) / 12)).tolist()
+                noise_buffer = np_rng.normal(0, 2.5, LIVE_BUFFER_SIZE).tolist()
+                i = 0
+            seasonal = seasonal_buffer[i]
+            noise = noise_buffer[i]
+            i += 1
             value = baseline + seasonal + noise
             is_anomaly = False
             severity = "normal"
-            if random.random() < 0.07:
-                spike = random.choice([random.uniform(18, 35), random.uniform(-30, -15)])
+            if _random() < 0.07:
+                spike = _choice([_uniform(18, 35), _uniform(-30, -15)])
                 value += spike
                 is_anomaly = True
                 severity = "high" if spike > 0 else "medium"
             payload = {
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
+                "timestamp": _now(utc).replace(tzinfo=None).isoformat(timespec="seconds"),
                 "value": round(value, 3),
                 "baseline": baseline,
                 "seasonal": round(seasonal, 3),
                 "is_anomaly": is_anomaly,
                 "severity": severity,
             }
-            yield f"data: {json.dumps(payload)}\n\n"
-            time.sleep(1)
+            yield f"data: {_dumps(payload).decode()}\n\n"
+            _sleep(1)
             t += 1
 
     headers = {
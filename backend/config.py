@@ -7,7 +7,7 @@ from typing import Optional
 import os
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Base configuration shared by all environments."""
 
@@ -16,6 +16,7 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
     PORT: int = int(os.environ.get("PORT", 5000))
     ENVIRONMENT: str = os.environ.get("ENVIRONMENT", "development")
+    ARROW_DTYPE_BACKEND: bool = os.environ.get("ARROW_DTYPE_BACKEND", "false").lower() == "true"
 
 
 def load_config() -> Config:
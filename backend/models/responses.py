@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 
 class AnomalyRecord(BaseModel):
     """Represents a detected anomaly."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     timestamp: str
     metric: str
     severity: str
@@ -20,6 +22,8 @@ class AnomalyRecord(BaseModel):
 class ForecastRecord(BaseModel):
     """Represents a single forecasted data point."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     date: str
     prediction: float
 
@@ -27,6 +31,8 @@ class ForecastRecord(BaseModel):
 class HistoricalRecord(BaseModel):
     """Represents a historical data point for charting."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     date: str
     value: float
 
@@ -34,6 +40,8 @@ class HistoricalRecord(BaseModel):
 class Metrics(BaseModel):
     """Key performance indicators returned with the analysis."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     rows_processed: int
     anomalies_detected: int
     forecast_horizon: int
@@ -45,6 +53,8 @@ class Metrics(BaseModel):
 class AnalysisResponse(BaseModel):
     """Envelope for analysis results."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     anomalies: List[AnomalyRecord]
     forecast: List[ForecastRecord]
     historical: List[HistoricalRecord]
@@ -0,0 +1,104 @@
+"""Numba kernels backing the analytics service."""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+SEVERITY_MEDIUM = 1
+SEVERITY_HIGH = 2
+
+
+# fastmath without the no-NaN/no-inf assumptions, which the kernels rely on to skip missing values.
+@njit(fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, cache=True)
+def zscore_anomalies(
+    values: np.ndarray,
+    threshold: float,
+    out_idx: np.ndarray,
+    out_z: np.ndarray,
+    out_sev: np.ndarray,
+) -> int:
+    """Score ``values`` and write the anomalies into the preallocated output buffers.
+
+    Mean and variance are accumulated in a single Welford pass over the non-NaN
+    values; a second pass writes the position, z-score and severity code of every
+    value whose magnitude exceeds ``threshold`` and returns how many were written.
+    NaNs are never flagged and a constant series yields no anomalies.
+    """
+    size = values.shape[0]
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(size):
+        value = values[i]
+        if np.isnan(value):
+            continue
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+
+    if count == 0 or m2 == 0.0:
+        return 0
+
+    std = np.sqrt(m2 / count)
+    written = 0
+    for i in range(size):
+        z_score = (values[i] - mean) / std
+        magnitude = abs(z_score)
+        if magnitude > threshold:
+            out_idx[written] = i
+            out_z[written] = z_score
+            out_sev[written] = SEVERITY_HIGH if magnitude > threshold + 1 else SEVERITY_MEDIUM
+            written += 1
+    return written
+
+
+@njit(cache=True)
+def holt_damped(values: np.ndarray, alpha: float, beta: float, phi: float) -> tuple[float, float, float]:
+    """Run damped-trend Holt smoothing over ``values``.
+
+    Returns the final level and trend plus the sum of squared one-step-ahead
+    errors, which the caller uses to compare smoothing parameters.
+    """
+    level = values[0]
+    trend = values[1] - values[0]
+    sse = 0.0
+    for i in range(1, values.shape[0]):
+        expected = level + phi * trend
+        error = values[i] - expected
+        sse += error * error
+        new_level = alpha * values[i] + (1.0 - alpha) * expected
+        trend = beta * (new_level - level) + (1.0 - beta) * phi * trend
+        level = new_level
+    return level, trend, sse
+
+
+@njit(cache=True)
+def holt_damped_forecast(
+    values: np.ndarray,
+    alphas: np.ndarray,
+    betas: np.ndarray,
+    phi: float,
+    horizon: int,
+) -> np.ndarray:
+    """Forecast ``horizon`` steps with the (alpha, beta) grid pair that fits ``values`` best."""
+    best_level = 0.0
+    best_trend = 0.0
+    best_sse = np.inf
+    for alpha in alphas:
+        for beta in betas:
+            level, trend, sse = holt_damped(values, alpha, beta, phi)
+            if sse < best_sse:
+                best_level = level
+                best_trend = trend
+                best_sse = sse
+
+    forecast = np.empty(horizon, dtype=np.float64)
+    damping = 0.0
+    phi_power = 1.0
+    for h in range(horizon):
+        phi_power *= phi
+        damping += phi_power
+        forecast[h] = best_level + damping * best_trend
+    return forecast
@@ -2,24 +2,51 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import itertools
+import os
+import threading
+import time
+from typing import Any, Iterator, Optional, Sequence
 from sqlalchemy import create_engine, inspect, select, text, MetaData, Table
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql import Select
+import numpy as np
 import pandas as pd
 
 class DatabaseService:
     """Handles connections to relational databases."""
 
-    def __init__(self, database_url: str) -> None:
+    FETCH_CHUNK_SIZE = 50_000
+    REFLECTION_TTL = 60.0
+    CONNECTORX_DIALECTS = {"postgresql", "mysql", "sqlite", "mssql", "oracle"}
+
+    def __init__(self, database_url: str, pool_size: int = 5, pool_recycle: int = 1800) -> None:
         self._database_url = database_url
+        self._pool_size = pool_size
+        self._pool_recycle = pool_recycle
         self._engine: Engine | None = None
+        self._metadata = MetaData()
+        self._tables: dict[str, tuple[Table, float]] = {}
+        self._tables_lock = threading.Lock()
 
     def connect(self) -> Engine:
         """Create and cache a SQLAlchemy engine."""
         if self._engine is None:
-            self._engine = create_engine(self._database_url, pool_pre_ping=True)
+            self._engine = create_engine(
+                self._database_url,
+                pool_pre_ping=True,
+                pool_size=self._pool_size,
+                pool_recycle=self._pool_recycle,
+            )
         return self._engine
 
+    def dispose(self) -> None:
+        """Close pooled connections; the engine is recreated on the next ``connect``."""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
     def validate_connection(self) -> bool:
         """Attempt a simple connection to ensure credentials are valid."""
         engine = self.connect()
@@ -37,14 +64,219 @@ class DatabaseService:
             tables.append({"name": table_name, "columns": columns})
         return tables
 
-    def fetch_table(self, table_name: str, limit: Optional[int] = None) -> pd.DataFrame:
-        """Load the provided table into a pandas DataFrame."""
+    def fetch_table(
+        self,
+        table_name: str,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Load the provided table into a pandas DataFrame.
+
+        ``columns`` projects the SELECT down to the requested columns and ``order_by``
+        sorts ascending on the server. Names that do not exist in the table are skipped
+        so callers can report missing columns from the returned frame. Pass
+        ``dtype_backend="pyarrow"`` to load Arrow-backed columns (requires pyarrow).
+        """
+        try:
+            return self._fetch(table_name, limit, columns, order_by, dtype_backend)
+        except DBAPIError:
+            # The cached reflection may predate a schema change; reflect again and retry once.
+            self._forget_table(table_name)
+            return self._fetch(table_name, limit, columns, order_by, dtype_backend)
+
+    def _fetch(
+        self,
+        table_name: str,
+        limit: Optional[int],
+        columns: Optional[Sequence[str]],
+        order_by: Optional[str],
+        dtype_backend: Optional[str],
+    ) -> pd.DataFrame:
+        engine = self.connect()
+        stmt = self._select(table_name, limit, columns, order_by)
+        frame = self._read_arrow(stmt, engine, dtype_backend)
+        if frame is not None:
+            return frame
+
+        chunks = list(self._read_chunks(stmt, engine, self.FETCH_CHUNK_SIZE, dtype_backend))
+        return pd.concat(self._align_null_chunks(chunks), ignore_index=True)
+
+    def iter_table(
+        self,
+        table_name: str,
+        chunk_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the table as DataFrames of at most ``chunk_size`` rows.
+
+        Takes the same projection and ordering arguments as ``fetch_table`` but never
+        holds the whole result at once. With connectorx installed the rows arrive as an
+        Arrow record batch stream.
+        """
         engine = self.connect()
-        metadata = MetaData()
-        table = Table(table_name, metadata, autoload_with=engine)
-        stmt = select(table)
+        chunk_size = chunk_size or self.FETCH_CHUNK_SIZE
+        stmt = self._select(table_name, limit, columns, order_by)
+        reader = self._stream_arrow(stmt, engine, chunk_size)
+        if reader is None:
+            chunks = self._read_chunks(stmt, engine, chunk_size, dtype_backend)
+            try:
+                first = next(chunks, None)
+            except DBAPIError:
+                # Same stale-reflection retry as fetch_table, before anything is yielded.
+                self._forget_table(table_name)
+                stmt = self._select(table_name, limit, columns, order_by)
+                chunks = self._read_chunks(stmt, engine, chunk_size, dtype_backend)
+                first = next(chunks, None)
+            if first is not None:
+                yield first
+                yield from chunks
+            return
+        for batch in reader:
+            if dtype_backend == "pyarrow":
+                yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+            else:
+                yield batch.to_pandas()
+
+    @staticmethod
+    def _align_null_chunks(chunks: list[pd.DataFrame]) -> list[pd.DataFrame]:
+        """Cast all-NULL chunk columns to the dtype the other chunks inferred for them.
+
+        Chunks infer dtypes independently, so a chunk that only holds NULLs for a column
+        comes back as object. Casting it before ``pd.concat`` keeps the combined dtype the
+        same as a single read instead of relying on how concat treats all-NA entries.
+        """
+        if len(chunks) < 2:
+            return chunks
+        dtypes: dict[Any, Any] = {}
+        for chunk in chunks:
+            for column, series in chunk.items():
+                if column not in dtypes and series.notna().any():
+                    dtypes[column] = series.dtype
+        for column, dtype in list(dtypes.items()):
+            if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+                # NumPy integers cannot hold NULLs; a single read would have produced floats.
+                dtypes[column] = np.dtype(np.float64)
+            elif dtype == object or (isinstance(dtype, np.dtype) and dtype.kind == "b"):
+                del dtypes[column]
+
+        aligned = []
+        for chunk in chunks:
+            casts = {
+                column: dtypes[column]
+                for column, series in chunk.items()
+                if column in dtypes and series.dtype != dtypes[column] and series.isna().all()
+            }
+            aligned.append(chunk.astype(casts) if casts else chunk)
+        return aligned
+
+    def _select(
+        self,
+        table_name: str,
+        limit: Optional[int],
+        columns: Optional[Sequence[str]],
+        order_by: Optional[str],
+    ) -> Select:
+        table = self._reflect_table(table_name)
+        if columns:
+            stmt = select(*[table.c[name] for name in columns if name in table.c])
+        else:
+            stmt = select(table)
+        if order_by and order_by in table.c:
+            stmt = stmt.order_by(table.c[order_by].asc())
         if limit:
             stmt = stmt.limit(limit)
+        return stmt
+
+    @staticmethod
+    def _read_chunks(
+        stmt: Select,
+        engine: Engine,
+        chunk_size: int,
+        dtype_backend: Optional[str],
+    ) -> Iterator[pd.DataFrame]:
+        """Stream ``stmt`` through ``pd.read_sql`` on a server-side cursor."""
+        read_kwargs: dict[str, Any] = {"chunksize": chunk_size}
+        if dtype_backend:
+            read_kwargs["dtype_backend"] = dtype_backend
         with engine.connect() as connection:
-            frame = pd.read_sql(stmt, connection)
-        return frame
+            streaming = connection.execution_options(stream_results=True)
+            yield from pd.read_sql(stmt, streaming, **read_kwargs)
+
+    def _read_arrow(self, stmt: Select, engine: Engine, dtype_backend: Optional[str]) -> pd.DataFrame | None:
+        """Load ``stmt`` straight into Arrow with connectorx, or return None when it cannot be used."""
+        source = self._connectorx_source(stmt, engine)
+        if source is None:
+            return None
+        cx, url, query = source
+        try:
+            table = cx.read_sql(url, query, return_type="arrow")
+        except Exception:  # pylint: disable=broad-except
+            # connectorx rejects some URLs, driver options and column types that
+            # SQLAlchemy handles; the chunked read_sql path covers those.
+            return None
+        if dtype_backend == "pyarrow":
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return table.to_pandas()
+
+    def _stream_arrow(self, stmt: Select, engine: Engine, chunk_size: int) -> Iterator[Any] | None:
+        """Return connectorx Arrow record batches for ``stmt``, or None when it cannot be used.
+
+        The first batch is read up front so connection and query errors still fall back
+        to the chunked path before anything has been yielded.
+        """
+        source = self._connectorx_source(stmt, engine)
+        if source is None:
+            return None
+        cx, url, query = source
+        try:
+            reader = iter(cx.read_sql(url, query, return_type="arrow_stream", batch_size=chunk_size))
+            first = next(reader, None)
+        except Exception:  # pylint: disable=broad-except
+            return None
+        if first is None:
+            return iter(())
+        return itertools.chain([first], reader)
+
+    def _connectorx_source(self, stmt: Select, engine: Engine) -> tuple[Any, str, str] | None:
+        """Return the connectorx module, URL and SQL for ``stmt``, or None when it does not apply."""
+        if engine.dialect.name not in self.CONNECTORX_DIALECTS:
+            return None
+        url = engine.url.set(drivername=engine.dialect.name)
+        if url.get_backend_name() == "sqlite":
+            # connectorx does not resolve relative paths the way sqlite3 does and has no
+            # in-memory databases, so pass it an absolute file path or skip it.
+            if not url.database or url.database == ":memory:" or url.database.startswith("file:"):
+                return None
+            url = url.set(database=os.path.abspath(url.database), query={})
+        try:
+            import connectorx as cx
+        except ImportError:
+            return None
+
+        query = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+        # connectorx takes plain scheme URLs without the SQLAlchemy driver suffix.
+        return cx, url.render_as_string(hide_password=False), query
+
+    def _reflect_table(self, table_name: str) -> Table:
+        """Reflect ``table_name`` and reuse the Table for ``REFLECTION_TTL`` seconds."""
+        with self._tables_lock:
+            cached = self._tables.get(table_name)
+            if cached is not None and time.monotonic() - cached[1] < self.REFLECTION_TTL:
+                return cached[0]
+            if cached is not None:
+                self._metadata.remove(cached[0])
+            table = Table(table_name, self._metadata, autoload_with=self.connect())
+            self._tables[table_name] = (table, time.monotonic())
+        return table
+
+    def _forget_table(self, table_name: str) -> None:
+        """Drop the cached reflection of ``table_name`` so the next fetch reflects it again."""
+        with self._tables_lock:
+            cached = self._tables.pop(table_name, None)
+            if cached is not None:
+                self._metadata.remove(cached[0])
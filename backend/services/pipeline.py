@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
+
+import numpy as np
 import pandas as pd
 
+DATE_RE = re.compile(r"^\d{4}([-/])\d{2}\1\d{2}")
+MAX_UNPARSED_DATE_FRACTION = 0.05
+
 
 class DataPipelineService:
     """Runs cleaning and normalization steps on raw data frames."""
@@ -13,14 +19,19 @@ class DataPipelineService:
         self._steps: list[str] = []
 
     def clean(self, frame: pd.DataFrame) -> pd.DataFrame:
-        """Apply basic cleaning operations."""
-        df = frame.copy()
+        """Apply basic cleaning operations.
 
-        before_rows = len(df)
-        df = df.drop_duplicates()
+        The input frame is never mutated: ``drop_duplicates`` returns a new frame,
+        which the remaining steps then modify in place.
+        """
+        before_rows = len(frame)
+        df = frame.drop_duplicates()
         removed = before_rows - len(df)
         self._steps.append("drop_duplicates")
         if removed:
+            # Row removal returns a frame pandas tracks as a slice of ``frame``; a shallow
+            # copy drops that link so the column assignments below do not warn.
+            df = df.copy(deep=False)
             self._steps.append(f"drop_duplicates_removed:{removed}")
 
         empty_columns = [col for col in df.columns if df[col].isna().all()]
@@ -28,52 +39,101 @@ class DataPipelineService:
             df = df.drop(columns=empty_columns)
             self._steps.append(f"drop_empty_columns:{','.join(empty_columns)}")
 
-        # Attempt to convert string columns that look like datetimes
-        for column in df.select_dtypes(include=["object"]).columns:
-            try:
-                converted = pd.to_datetime(df[column], errors="raise")
-            except (ValueError, TypeError):
-                continue
-            if converted.notna().any():
-                df[column] = converted
-                self._steps.append(f"parse_datetime:{column}")
-
-        numeric_columns = df.select_dtypes(include=["number"]).columns
-        if len(numeric_columns) > 0:
-            medians = df[numeric_columns].median()
-            df[numeric_columns] = df[numeric_columns].fillna(medians)
+        # Single scan over the columns: parse datetime-like strings, then fill gaps by dtype.
+        parsed_columns: list[str] = []
+        has_numeric = False
+        has_categorical = False
+        for column, series in df.items():
+            dtype = series.dtype
+            is_text = pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+            if is_text:
+                options = self._date_options(series)
+                converted = None if options is None else self._coerce_dates(series, options)
+                if converted is not None:
+                    df[column] = converted
+                    parsed_columns.append(column)
+                    continue
+
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                has_numeric = True
+                if series.isna().any():
+                    df[column] = series.fillna(series.median())
+            elif is_text or isinstance(dtype, pd.CategoricalDtype):
+                has_categorical = True
+                if series.isna().any():
+                    mode_series = series.mode(dropna=True)
+                    if not mode_series.empty:
+                        df[column] = series.fillna(mode_series[0])
+
+        self._steps.extend(f"parse_datetime:{column}" for column in parsed_columns)
+        if has_numeric:
             self._steps.append("fill_numeric_missing:median")
-
-        categorical_columns = df.select_dtypes(include=["object", "category"]).columns
-        if len(categorical_columns) > 0:
-            for column in categorical_columns:
-                mode_series = df[column].mode(dropna=True)
-                if not mode_series.empty:
-                    df[column] = df[column].fillna(mode_series[0])
+        if has_categorical:
             self._steps.append("fill_categorical_missing:mode")
 
         return df
 
+    @staticmethod
+    def _date_options(series: pd.Series) -> dict[str, str] | None:
+        """Return ``pd.to_datetime`` options when ``series`` looks like year-first dates.
+
+        Only the first non-null value of a text column is probed, so free-text columns
+        are skipped without a parse attempt.
+        """
+        dtype = series.dtype
+        if not (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+            return None
+        present = series.notna().to_numpy()
+        if not present.any():
+            return None
+        match = DATE_RE.match(str(series.iloc[present.argmax()]))
+        if match is None:
+            return None
+        # Dash-separated values take pandas' fast ISO-8601 path; slashes need inference.
+        return {"format": "ISO8601"} if match.group(1) == "-" else {}
+
+    @staticmethod
+    def _coerce_dates(series: pd.Series, options: dict[str, str]) -> pd.Series | None:
+        """Parse ``series`` with ``options``, or return ``None`` when too many values fail.
+
+        A column stays text when more than ``MAX_UNPARSED_DATE_FRACTION`` of its non-null
+        values do not parse.
+        """
+        try:
+            converted = pd.to_datetime(series, errors="coerce", **options)
+        except (ValueError, TypeError):
+            return None
+        present = series.notna().to_numpy()
+        unparsed = np.count_nonzero(present & converted.isna().to_numpy())
+        if unparsed > MAX_UNPARSED_DATE_FRACTION * np.count_nonzero(present):
+            return None
+        return converted
+
     def normalize(self, frame: pd.DataFrame) -> pd.DataFrame:
-        """Apply normalization/encoding to prepared data."""
-        df = frame.copy()
+        """Apply normalization/encoding to prepared data.
+
+        Works on a shallow copy: columns are replaced rather than written into,
+        so the input frame's data is left untouched without duplicating it up front.
+        """
+        df = frame.copy(deep=False)
 
         numeric_columns = df.select_dtypes(include=["number"]).columns
-        standardized_columns: list[str] = []
-        for column in numeric_columns:
-            std = df[column].std(ddof=0)
-            if std and std != 0:
-                df[column] = (df[column] - df[column].mean()) / std
-            else:
-                df[column] = 0.0
-            standardized_columns.append(column)
+        standardized_columns = list(numeric_columns)
+        if standardized_columns:
+            values = df[standardized_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            means = np.nanmean(values, axis=0)
+            stds = np.nanstd(values, axis=0)
+            constant = stds == 0
+            standardized = (values - means) / np.where(constant, 1.0, stds)
+            standardized[:, constant] = 0.0
+            df[standardized_columns] = standardized
 
         if standardized_columns:
             self._steps.append(f"standard_scale:{','.join(standardized_columns)}")
 
-        categorical_columns = df.select_dtypes(include=["object", "category"]).columns
+        categorical_columns = df.select_dtypes(include=["object", "string", "category"]).columns
         if len(categorical_columns) > 0:
-            df = pd.get_dummies(df, columns=list(categorical_columns), drop_first=True)
+            df = pd.get_dummies(df, columns=list(categorical_columns), drop_first=True, sparse=True, dtype=np.int8)
             self._steps.append(f"one_hot_encode:{','.join(categorical_columns)}")
 
         return df
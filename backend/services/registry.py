@@ -11,17 +11,25 @@ class ConnectionRegistry:
 
     def __init__(self) -> None:
         self._connections: Dict[str, str] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation so callers can invalidate cached lookups."""
+        return self._version
 
     def register(self, database_url: str) -> str:
-        token = str(uuid4())
+        token = uuid4().hex
         self._connections[token] = database_url
+        self._version += 1
         return token
 
     def resolve(self, token: str) -> str | None:
         return self._connections.get(token)
 
     def remove(self, token: str) -> None:
-        self._connections.pop(token, None)
+        if self._connections.pop(token, None) is not None:
+            self._version += 1
 
 
 registry = ConnectionRegistry()
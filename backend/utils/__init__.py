@@ -1,3 +1,4 @@
 """Utility helpers for Forecast Alpha backend."""
 
 from .db import build_connection_url  # noqa: F401
+from .dates import isoformat_values  # noqa: F401
@@ -0,0 +1,19 @@
+"""Utility helpers for formatting date columns."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def isoformat_values(values: pd.Series) -> np.ndarray:
+    """Format a column of timestamps as ISO-8601 strings in a single pass."""
+    if isinstance(values.dtype, pd.ArrowDtype) and values.dtype.kind == "M":
+        # pd.to_datetime keeps timestamp[ns] columns Arrow-backed, so cast to NumPy explicitly.
+        tz = values.dtype.pyarrow_dtype.tz
+        values = values.astype(pd.DatetimeTZDtype("ns", tz) if tz else "datetime64[ns]")
+    if pd.api.types.is_datetime64_dtype(values.dtype):
+        return np.datetime_as_string(values.to_numpy().astype("datetime64[s]"), unit="s")
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        return np.array([value.isoformat() for value in values], dtype=object)
+    return values.astype(str).to_numpy()
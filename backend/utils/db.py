@@ -6,6 +6,13 @@ from typing import Dict, Optional
 from urllib.parse import quote_plus
 
 
+def _quote(value: str) -> str:
+    """Percent-encode ``value`` unless it is plain ASCII alphanumeric."""
+    if value.isascii() and value.isalnum():
+        return value
+    return quote_plus(value)
+
+
 def build_connection_url(
     driver: str,
     username: str,
@@ -16,13 +23,8 @@ def build_connection_url(
     options: Optional[Dict[str, str]] = None,
 ) -> str:
     """Construct a SQLAlchemy-compatible database URL."""
-    user = quote_plus(username)
-    pwd = quote_plus(password)
-    base = f"{driver}://{user}:{pwd}@{host}:{port}/{database}"
+    base = f"{driver}://{_quote(username)}:{_quote(password)}@{host}:{port}/{database}"
     if options:
-        query = "&".join(
-            f"{key}={quote_plus(str(value))}"
-            for key, value in options.items()
-        )
+        query = "&".join([f"{key}={_quote(str(value))}" for key, value in options.items()])
         return f"{base}?{query}"
     return base
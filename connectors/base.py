@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import importlib.util
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import orjson
+
+# HTTP/2 needs the optional ``h2`` package; fall back to HTTP/1.1 keep-alive without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 @dataclass(slots=True)
@@ -15,6 +22,8 @@ class ConnectorConfig:
     workspace_token: str
     gateway_url: str
     metadata: Dict[str, Any] = field(default_factory=dict)
+    batch_size: int = 1
+    flush_interval: float = 1.0
 
 
 @dataclass(slots=True)
@@ -38,18 +47,75 @@ class BaseConnector(abc.ABC):
         """Yield metric samples as they are available."""
 
     async def run(self) -> None:
-        """Continuously stream samples to the gateway."""
+        """Continuously stream samples to the gateway.
+
+        With ``batch_size`` above one, samples are posted to ``/ingest/batch`` once
+        ``batch_size`` have accumulated or ``flush_interval`` seconds have passed.
+        """
         import httpx
 
-        async with httpx.AsyncClient() as client:
-            async for sample in self.stream():
-                payload = {
-                    "token": self.config.workspace_token,
-                    "event": {
-                        "metric": sample.metric,
-                        "timestamp": sample.timestamp.isoformat(),
-                        "value": sample.value,
-                        "context": sample.context,
-                    },
-                }
-                await client.post(f"{self.config.gateway_url}/ingest", json=payload, timeout=10)
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits, timeout=10) as client:
+            if self.config.batch_size > 1:
+                await self._run_batched(client)
+            else:
+                await self._run_single(client)
+
+    async def _run_single(self, client: Any) -> None:
+        url = f"{self.config.gateway_url}/ingest"
+        async for sample in self.stream():
+            await self._post(client, url, {"token": self.config.workspace_token, "event": _event(sample)})
+
+    async def _run_batched(self, client: Any) -> None:
+        url = f"{self.config.gateway_url}/ingest/batch"
+        loop = asyncio.get_running_loop()
+        samples = self.stream().__aiter__()
+        events: List[Dict[str, Any]] = []
+        deadline = 0.0
+        pending: Optional[asyncio.Future] = None
+
+        async def flush() -> None:
+            payload = {"token": self.config.workspace_token, "events": events.copy()}
+            events.clear()
+            await self._post(client, url, payload)
+
+        try:
+            while True:
+                # Wait on a task rather than wait_for so a flush timeout never cancels the stream.
+                if pending is None:
+                    pending = asyncio.ensure_future(samples.__anext__())
+                timeout = max(deadline - loop.time(), 0.0) if events else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    await flush()
+                    continue
+                next_sample, pending = pending, None
+                try:
+                    sample = next_sample.result()
+                except StopAsyncIteration:
+                    break
+                if not events:
+                    deadline = loop.time() + self.config.flush_interval
+                events.append(_event(sample))
+                if len(events) >= self.config.batch_size:
+                    await flush()
+            if events:
+                await flush()
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    @staticmethod
+    async def _post(client: Any, url: str, payload: Dict[str, Any]) -> None:
+        # orjson encodes the datetime itself; naive timestamps are sent as UTC.
+        content = orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+        await client.post(url, content=content, headers={"Content-Type": "application/json"})
+
+
+def _event(sample: MetricSample) -> Dict[str, Any]:
+    return {
+        "metric": sample.metric,
+        "timestamp": sample.timestamp,
+        "value": sample.value,
+        "context": sample.context,
+    }
@@ -7,6 +7,7 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Set
 
+import orjson
 from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
@@ -28,6 +29,13 @@ class IngestRequest(BaseModel):
     event: MetricEvent
 
 
+class IngestBatchRequest(BaseModel):
+    """Body of the batch ingest endpoint."""
+
+    token: str = Field(..., description="Workspace access token")
+    events: List[MetricEvent] = Field(..., description="Events in the order they were sampled")
+
+
 class WorkspaceRegistry:
     """In-memory workspace auth + broadcast manager.
 
@@ -59,17 +67,27 @@ class WorkspaceRegistry:
     async def broadcast(self, workspace_id: str, payload: Dict[str, Any]) -> None:
         async with self._locks[workspace_id]:
             websockets: List[WebSocket] = list(self._connections[workspace_id])
-        message = payload | {"workspace_id": workspace_id}
+        if not websockets:
+            return
+        # Serialize once for every subscriber; text frames keep browser JSON clients working.
+        message = orjson.dumps(payload | {"workspace_id": workspace_id}).decode()
+        results = await asyncio.gather(
+            *(ws.send_text(message) for ws in websockets),
+            return_exceptions=True,
+        )
         stale: List[WebSocket] = []
-        for ws in websockets:
-            try:
-                await ws.send_json(message)
-            except RuntimeError:
+        error: BaseException | None = None
+        for ws, result in zip(websockets, results):
+            if isinstance(result, (RuntimeError, WebSocketDisconnect)):
                 stale.append(ws)
+            elif isinstance(result, BaseException) and error is None:
+                error = result
         if stale:
             async with self._locks[workspace_id]:
                 for ws in stale:
                     self._connections[workspace_id].discard(ws)
+        if error is not None:
+            raise error
 
 
 registry = WorkspaceRegistry()
@@ -91,6 +109,13 @@ def create_app() -> FastAPI:
         await registry.broadcast(workspace_id, request.event.model_dump())
         return {"status": "queued"}
 
+    @app.post("/ingest/batch", status_code=202)
+    async def ingest_batch(request: IngestBatchRequest) -> Dict[str, str]:
+        workspace_id = registry.authenticate(request.token)
+        for event in request.events:
+            await registry.broadcast(workspace_id, event.model_dump())
+        return {"status": "queued"}
+
     async def get_workspace(token: str) -> str:
         return registry.authenticate(token)
 
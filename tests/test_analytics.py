@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import pandas as pd
+import pytest
+from cachetools import LRUCache
 
 from backend.services import AnalyticsService
+from backend.services import analytics as analytics_module
 
 
 def _build_sample_frame() -> pd.DataFrame:
@@ -23,6 +26,28 @@ def test_detect_anomalies_flags_outliers():
     assert any(anomaly["severity"] in {"high", "medium"} for anomaly in anomalies)
 
 
+def test_zscore_anomalies_report_timestamp_and_value():
+    frame = _build_sample_frame()
+    service = AnalyticsService(anomaly_threshold=2.0)
+    anomalies = service.detect_anomalies(frame, "revenue", "date")
+    assert len(anomalies) == 1
+    assert anomalies[0]["timestamp"] == "2024-01-04T00:00:00"
+    assert anomalies[0]["value"] == 400.0
+    assert anomalies[0]["severity"] == "medium"
+
+
+def test_zscore_anomalies_skip_missing_values():
+    frame = _build_sample_frame()
+    frame["revenue"] = frame["revenue"].astype(float)
+    frame.loc[1, "revenue"] = None
+    service = AnalyticsService(anomaly_threshold=1.5)
+    anomalies = service.detect_anomalies(frame, "revenue", "date")
+    values = frame["revenue"].dropna()
+    expected_z = (400 - values.mean()) / values.std(ddof=0)
+    assert [anomaly["value"] for anomaly in anomalies] == [400.0]
+    assert anomalies[0]["z_score"] == pytest.approx(expected_z)
+
+
 def test_forecast_returns_requested_periods():
     frame = _build_sample_frame()
     service = AnalyticsService(forecast_periods=2)
@@ -32,6 +57,19 @@ def test_forecast_returns_requested_periods():
         assert "date" in record and "prediction" in record
 
 
+def test_linear_regression_forecast_extends_trend():
+    frame = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=4, freq="D"),
+            "revenue": [10.0, 12.0, 14.0, 16.0],
+        }
+    )
+    service = AnalyticsService(forecast_periods=2)
+    forecast = service.forecast(frame, "revenue", "date")
+    assert [record["prediction"] for record in forecast] == pytest.approx([18.0, 20.0])
+    assert [record["date"] for record in forecast] == ["2024-01-05T00:00:00", "2024-01-06T00:00:00"]
+
+
 def test_isolation_forest_anomaly_method():
     frame = _build_sample_frame()
     service = AnalyticsService(anomaly_method="isolation_forest", max_samples=None)
@@ -44,3 +82,46 @@ def test_holt_winters_forecast_method():
     service = AnalyticsService(forecast_method="holt_winters", forecast_periods=2)
     forecast = service.forecast(frame, "revenue", "date")
     assert len(forecast) == 2
+
+
+def test_holt_winters_precise_forecast_method():
+    frame = _build_sample_frame()
+    service = AnalyticsService(forecast_method="holt_winters", forecast_periods=2, precise_forecast=True)
+    forecast = service.forecast(frame, "revenue", "date")
+    assert len(forecast) == 2
+
+
+@pytest.mark.parametrize(
+    ("dates", "expected"),
+    [
+        (["2024-01-01", "2024-01-03", "2024-01-04", "2024-01-06"], ["2024-01-08T00:00:00", "2024-01-10T00:00:00"]),
+        (pd.date_range("2024-01-31", periods=4, freq="ME"), ["2024-05-31T00:00:00", "2024-06-30T00:00:00"]),
+    ],
+)
+def test_forecast_dates_follow_median_step_or_calendar(dates, expected):
+    frame = pd.DataFrame({"date": dates, "revenue": [float(i) for i in range(len(dates))]})
+    service = AnalyticsService(forecast_periods=2)
+    forecast = service.forecast(frame, "revenue", "date")
+    assert [record["date"] for record in forecast] == expected
+
+
+@pytest.fixture()
+def empty_holt_cache(monkeypatch):
+    monkeypatch.setattr(analytics_module, "_HOLT_CACHE", LRUCache(maxsize=128))
+
+
+def test_holt_winters_reuses_cached_fit_for_identical_series(monkeypatch, empty_holt_cache):
+    calls = []
+    kernel = analytics_module.holt_damped_forecast
+
+    def counting_kernel(*args):
+        calls.append(args)
+        return kernel(*args)
+
+    monkeypatch.setattr(analytics_module, "holt_damped_forecast", counting_kernel)
+    frame = _build_sample_frame()
+    service = AnalyticsService(forecast_method="holt_winters", forecast_periods=2)
+    first = service.forecast(frame, "revenue", "date")
+    second = service.forecast(frame.copy(), "revenue", "date")
+    assert len(calls) == 1
+    assert second == first
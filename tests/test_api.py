@@ -0,0 +1,293 @@
+"""Tests for the analysis API workflow."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from backend.api import routes
+from backend.app import create_app
+from backend.config import Config
+from backend.services import DatabaseService
+from backend.services.registry import registry
+
+
+def _seed_and_connect(client, tmp_path, frame: pd.DataFrame | None = None) -> str:
+    database_url = f"sqlite:///{tmp_path / 'metrics.db'}"
+    if frame is None:
+        frame = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=8, freq="D").strftime("%Y-%m-%d"),
+                "revenue": [100, 105, 110, 400, 115, 120, 118, 122],
+            }
+        )
+    engine = create_engine(database_url)
+    frame.to_sql("sales", engine, index=False)
+    engine.dispose()
+
+    response = client.post(
+        "/api/connect",
+        json={
+            "host": "localhost",
+            "username": "demo",
+            "password": "demo",
+            "database": "metrics",
+            "engine_url": database_url,
+        },
+    )
+    assert response.status_code == 200
+    return response.get_json()["connection_id"]
+
+
+@pytest.fixture()
+def connection_id(client, tmp_path):
+    return _seed_and_connect(client, tmp_path)
+
+
+def test_analyze_returns_sorted_historical_series(client, connection_id):
+    response = client.post(
+        "/api/analyze",
+        json={
+            "connection_id": connection_id,
+            "table": "sales",
+            "feature_columns": [],
+            "target_column": "revenue",
+            "date_column": "date",
+            "anomaly_threshold": 2.0,
+        },
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["historical"][0] == {"date": "2024-01-01T00:00:00", "value": 100.0}
+    assert len(data["historical"]) == 8
+    assert data["anomalies"][0]["timestamp"] == "2024-01-04T00:00:00"
+    assert data["metrics"]["rows_processed"] == 8
+
+
+def test_analyze_rejects_unknown_connection(client):
+    response = client.post(
+        "/api/analyze",
+        json={
+            "connection_id": "missing",
+            "table": "sales",
+            "feature_columns": [],
+            "target_column": "revenue",
+        },
+    )
+    assert response.status_code == 404
+
+
+def test_analyze_streams_ndjson_batches(client, connection_id):
+    response = client.post(
+        "/api/analyze?stream=1",
+        json={
+            "connection_id": connection_id,
+            "table": "sales",
+            "feature_columns": [],
+            "target_column": "revenue",
+            "date_column": "date",
+            "anomaly_threshold": 2.0,
+            "forecast_periods": 2,
+        },
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [event["type"] for event in events] == ["meta", "historical", "anomalies", "forecast"]
+    assert events[0]["metrics"]["rows_processed"] == 8
+    assert len(events[1]["batch"]) == 8
+    assert len(events[3]["batch"]) == 2
+
+
+def test_analyze_rejects_malformed_body(client):
+    response = client.post("/api/analyze", data="{not json", content_type="application/json")
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "error"
+
+
+def test_analyze_reports_missing_columns(client, connection_id):
+    response = client.post(
+        "/api/analyze",
+        json={
+            "connection_id": connection_id,
+            "table": "sales",
+            "feature_columns": ["region"],
+            "target_column": "profit",
+            "date_column": "date",
+        },
+    )
+    assert response.status_code == 400
+    assert response.get_json()["missing_columns"] == ["profit"]
+
+
+def test_connect_reports_unreachable_database(client, tmp_path):
+    response = client.post(
+        "/api/connect",
+        json={
+            "host": "localhost",
+            "username": "demo",
+            "password": "demo",
+            "database": "metrics",
+            "engine_url": f"sqlite:///{tmp_path / 'missing' / 'metrics.db'}",
+        },
+    )
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "Unable to connect to database"
+    assert f"sqlite:///{tmp_path / 'missing' / 'metrics.db'}" not in routes._SERVICES
+
+
+def test_service_cache_disposes_evicted_engines(monkeypatch):
+    disposed = []
+    monkeypatch.setattr(DatabaseService, "dispose", lambda self: disposed.append(self))
+    cache = routes._ServiceCache(maxsize=1)
+    first = DatabaseService("sqlite://")
+    cache["first"] = first
+    cache["second"] = DatabaseService("sqlite://")
+    assert disposed == [first]
+    assert list(cache) == ["second"]
+
+
+def test_analyze_isolation_forest_normalizes_features(client, connection_id):
+    response = client.post(
+        "/api/analyze",
+        json={
+            "connection_id": connection_id,
+            "table": "sales",
+            "feature_columns": [],
+            "target_column": "revenue",
+            "date_column": "date",
+            "anomaly_method": "isolation_forest",
+        },
+    )
+    assert response.status_code == 200
+    steps = response.get_json()["pipeline_steps"]
+    assert any(step.startswith("standard_scale") for step in steps)
+
+
+def test_analyze_keeps_rows_that_differ_only_outside_requested_columns(client, tmp_path):
+    frame = pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03"],
+            "region": ["north", "south", "north", "south", "north"],
+            "units": [3, 4, 5, 6, 7],
+            "revenue": [100.0, 100.0, 110.0, 110.0, 120.0],
+        }
+    )
+
+    response = client.post(
+        "/api/analyze",
+        json={
+            "connection_id": _seed_and_connect(client, tmp_path, frame),
+            "table": "sales",
+            "feature_columns": [],
+            "target_column": "revenue",
+            "date_column": "date",
+            "anomaly_method": "isolation_forest",
+        },
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["metrics"]["rows_processed"] == 5
+    assert not any(step.startswith("drop_duplicates_removed") for step in data["pipeline_steps"])
+    assert "standard_scale:units,revenue" in data["pipeline_steps"]
+
+
+def test_analyze_with_arrow_dtype_backend(tmp_path):
+    pytest.importorskip("pyarrow")
+    app = create_app(Config(ARROW_DTYPE_BACKEND=True))
+    client = app.test_client()
+    response = client.post(
+        "/api/analyze",
+        json={
+            "connection_id": _seed_and_connect(client, tmp_path),
+            "table": "sales",
+            "feature_columns": [],
+            "target_column": "revenue",
+            "date_column": "date",
+            "anomaly_threshold": 2.0,
+        },
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["historical"][0] == {"date": "2024-01-01T00:00:00", "value": 100.0}
+    assert data["anomalies"][0]["timestamp"] == "2024-01-04T00:00:00"
+
+
+def test_analyze_serves_repeated_requests_from_cache(client, connection_id):
+    payload = {
+        "connection_id": connection_id,
+        "table": "sales",
+        "feature_columns": [],
+        "target_column": "revenue",
+        "date_column": "date",
+    }
+    first = client.post("/api/analyze", json=payload)
+    second = client.post("/api/analyze", json=payload)
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.get_json() == first.get_json()
+
+
+def test_analyze_rejects_invalid_utf8_body(client):
+    response = client.post("/api/analyze", data=b'{"table": "\xff"}', content_type="application/json")
+    assert response.status_code == 400
+    assert response.get_json()["errors"][0]["type"] == "json_invalid"
+
+
+def test_concurrent_validations_share_one_ping(monkeypatch, tmp_path):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def blocking_validate(self):
+        calls.append(self)
+        started.set()
+        assert release.wait(timeout=5)
+        return True
+
+    class CountingLock:
+        """Signals once the follower has looked up the pending check."""
+
+        def __init__(self) -> None:
+            self.lock = threading.Lock()
+            self.exits = 0
+            self.follower_joined = threading.Event()
+
+        def __enter__(self):
+            self.lock.acquire()
+
+        def __exit__(self, *exc_info):
+            self.exits += 1
+            if self.exits == 2:
+                self.follower_joined.set()
+            self.lock.release()
+
+    pending_lock = CountingLock()
+    monkeypatch.setattr(routes, "_pending_lock", pending_lock)
+    monkeypatch.setattr(DatabaseService, "validate_connection", blocking_validate)
+    database_url = f"sqlite:///{tmp_path / 'shared.db'}"
+    results = []
+    owner = threading.Thread(target=lambda: results.append(routes._validate_once(database_url)))
+    owner.start()
+    assert started.wait(timeout=5)
+    follower = threading.Thread(target=lambda: results.append(routes._validate_once(database_url)))
+    follower.start()
+    assert pending_lock.follower_joined.wait(timeout=5)
+    release.set()
+    owner.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == [True, True]
+    assert routes._pending_validations == {}
+
+
+def test_removed_connection_is_not_served_from_resolve_cache(client, connection_id):
+    assert client.get(f"/api/tables?connection_id={connection_id}").status_code == 200
+    registry.remove(connection_id)
+    response = client.get(f"/api/tables?connection_id={connection_id}")
+    assert response.status_code == 404
@@ -0,0 +1,92 @@
+"""Tests for the connector SDK."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator
+
+import orjson
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from connectors import BaseConnector, ConnectorConfig, MetricSample  # noqa: E402
+
+
+class _ListConnector(BaseConnector):
+    def __init__(self, config: ConnectorConfig, samples: list[MetricSample], delay: float = 0.0) -> None:
+        super().__init__(config)
+        self.samples = samples
+        self.delay = delay
+
+    async def stream(self) -> AsyncIterator[MetricSample]:
+        for sample in self.samples:
+            await asyncio.sleep(self.delay)
+            yield sample
+
+
+def _samples(count: int) -> list[MetricSample]:
+    return [
+        MetricSample(metric="revenue", timestamp=datetime(2024, 1, 1, hour), value=float(hour))
+        for hour in range(count)
+    ]
+
+
+@pytest.fixture()
+def captured(monkeypatch):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(202, json={"status": "queued"})
+
+    client_class = httpx.AsyncClient
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return client_class(*args, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", client_factory)
+    return requests
+
+
+def test_run_posts_each_sample_as_json(captured):
+    config = ConnectorConfig(workspace_token="demo-token", gateway_url="http://gateway")
+    samples = [
+        MetricSample(metric="revenue", timestamp=datetime(2024, 1, 1, 12), value=1.5),
+        MetricSample(metric="revenue", timestamp=datetime(2024, 1, 1, 13), value=2.5, context={"region": "eu"}),
+    ]
+
+    asyncio.run(_ListConnector(config, samples).run())
+
+    assert [str(request.url) for request in captured] == ["http://gateway/ingest"] * 2
+    assert captured[0].headers["content-type"] == "application/json"
+    bodies = [orjson.loads(request.content) for request in captured]
+    assert bodies[0]["token"] == "demo-token"
+    assert bodies[0]["event"]["timestamp"] == "2024-01-01T12:00:00+00:00"
+    assert bodies[1]["event"]["context"] == {"region": "eu"}
+
+
+def test_run_batches_samples_by_size(captured):
+    config = ConnectorConfig(workspace_token="demo-token", gateway_url="http://gateway", batch_size=2)
+
+    asyncio.run(_ListConnector(config, _samples(5)).run())
+
+    assert {str(request.url) for request in captured} == {"http://gateway/ingest/batch"}
+    batches = [[event["value"] for event in orjson.loads(request.content)["events"]] for request in captured]
+    assert batches == [[0.0, 1.0], [2.0, 3.0], [4.0]]
+
+
+def test_run_flushes_partial_batch_after_interval(captured):
+    config = ConnectorConfig(
+        workspace_token="demo-token",
+        gateway_url="http://gateway",
+        batch_size=10,
+        flush_interval=0.01,
+    )
+
+    asyncio.run(_ListConnector(config, _samples(2), delay=0.05).run())
+
+    batches = [[event["value"] for event in orjson.loads(request.content)["events"]] for request in captured]
+    assert batches == [[0.0], [1.0]]
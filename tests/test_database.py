@@ -0,0 +1,116 @@
+"""Tests for the database service."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from backend.services import DatabaseService
+
+
+def _build_service(tmp_path, database_url: str | None = None) -> DatabaseService:
+    database_url = database_url or f"sqlite:///{tmp_path / 'metrics.db'}"
+    frame = pd.DataFrame(
+        {
+            "date": ["2024-01-03", "2024-01-01", "2024-01-04", "2024-01-02"],
+            "revenue": [None, None, 130.0, 110.0],
+            "region": ["north", "south", "east", "west"],
+        }
+    )
+    engine = create_engine(database_url)
+    frame.to_sql("sales", engine, index=False)
+    engine.dispose()
+    return DatabaseService(database_url)
+
+
+def test_fetch_table_projects_orders_and_limits(tmp_path):
+    service = _build_service(tmp_path)
+    frame = service.fetch_table("sales", limit=3, columns=["revenue", "date", "missing"], order_by="date")
+    assert list(frame.columns) == ["revenue", "date"]
+    assert frame["date"].tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def test_fetch_table_reads_in_chunks_and_reuses_reflection(tmp_path, monkeypatch):
+    service = _build_service(tmp_path)
+    monkeypatch.setattr(DatabaseService, "FETCH_CHUNK_SIZE", 2)
+    monkeypatch.setattr(DatabaseService, "_read_arrow", lambda *args: None)
+    first = service.fetch_table("sales")
+    second = service.fetch_table("sales", order_by="date")
+    assert len(first) == len(second) == 4
+    assert first["revenue"].dtype == "float64"
+    assert list(service._tables) == ["sales"]
+
+
+def test_fetch_table_via_connectorx_matches_sqlalchemy(tmp_path, monkeypatch):
+    pytest.importorskip("connectorx")
+    service = _build_service(tmp_path)
+    arrow_frame = service.fetch_table("sales", columns=["date", "revenue"], order_by="date")
+    monkeypatch.setattr(DatabaseService, "_read_arrow", lambda *args: None)
+    fallback_frame = service.fetch_table("sales", columns=["date", "revenue"], order_by="date")
+    pd.testing.assert_frame_equal(arrow_frame, fallback_frame)
+
+
+@pytest.mark.parametrize("use_connectorx", [True, False])
+def test_iter_table_yields_ordered_batches(tmp_path, monkeypatch, use_connectorx):
+    if use_connectorx:
+        pytest.importorskip("connectorx")
+    else:
+        monkeypatch.setattr(DatabaseService, "_stream_arrow", lambda *args: None)
+    service = _build_service(tmp_path)
+    batches = list(service.iter_table("sales", chunk_size=3, columns=["date", "region"], order_by="date"))
+    assert [len(batch) for batch in batches] == [3, 1]
+    frame = pd.concat(batches, ignore_index=True)
+    assert frame["date"].tolist() == ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+    assert frame["region"].tolist() == ["south", "west", "north", "east"]
+
+
+def test_relative_sqlite_url_reads_the_same_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = _build_service(tmp_path, "sqlite:///metrics.db")
+    assert service.validate_connection()
+    frame = service.fetch_table("sales", order_by="date")
+    batches = list(service.iter_table("sales", chunk_size=3, order_by="date"))
+    assert frame["region"].tolist() == ["south", "west", "north", "east"]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), frame)
+
+
+def test_connectorx_errors_fall_back_to_read_sql(tmp_path, monkeypatch):
+    cx = pytest.importorskip("connectorx")
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("unsupported column type")
+
+    monkeypatch.setattr(cx, "read_sql", fail)
+    service = _build_service(tmp_path)
+    assert len(service.fetch_table("sales")) == 4
+    assert sum(len(batch) for batch in service.iter_table("sales", chunk_size=3)) == 4
+
+
+def _recreate_sales(database_url: str, frame: pd.DataFrame) -> None:
+    engine = create_engine(database_url)
+    frame.to_sql("sales", engine, index=False, if_exists="replace")
+    engine.dispose()
+
+
+def test_fetch_table_reflects_again_after_a_schema_change(tmp_path):
+    service = _build_service(tmp_path)
+    assert "revenue" in service.fetch_table("sales").columns
+
+    database_url = f"sqlite:///{tmp_path / 'metrics.db'}"
+    _recreate_sales(database_url, pd.DataFrame({"date": ["2024-01-01"], "profit": [5.0]}))
+    assert list(service.fetch_table("sales").columns) == ["date", "profit"]
+    assert [list(batch.columns) for batch in service.iter_table("sales")] == [["date", "profit"]]
+
+
+def test_fetch_table_picks_up_added_columns_after_ttl(tmp_path, monkeypatch):
+    service = _build_service(tmp_path)
+    service.fetch_table("sales")
+
+    database_url = f"sqlite:///{tmp_path / 'metrics.db'}"
+    _recreate_sales(
+        database_url,
+        pd.DataFrame({"date": ["2024-01-01"], "revenue": [1.0], "region": ["north"], "units": [3]}),
+    )
+    monkeypatch.setattr(DatabaseService, "REFLECTION_TTL", 0.0)
+    assert list(service.fetch_table("sales").columns) == ["date", "revenue", "region", "units"]
@@ -0,0 +1,73 @@
+"""Tests for the live gateway service."""
+
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from services.gateway.app import WorkspaceRegistry, create_app  # noqa: E402
+
+
+class _FakeSocket:
+    def __init__(self, error: BaseException | None = None) -> None:
+        self.error = error
+        self.sent: list[str] = []
+
+    async def send_text(self, data: str) -> None:
+        if self.error is not None:
+            raise self.error
+        self.sent.append(data)
+
+
+def test_ingest_broadcasts_event_to_subscribers():
+    client = TestClient(create_app())
+    with client.websocket_connect("/ws/demo-token") as websocket:
+        response = client.post(
+            "/ingest",
+            json={
+                "token": "demo-token",
+                "event": {"metric": "revenue", "timestamp": "2024-01-01T00:00:00Z", "value": 12.5},
+            },
+        )
+        assert response.status_code == 202
+        message = websocket.receive_json()
+
+    assert message["metric"] == "revenue"
+    assert message["value"] == 12.5
+    assert message["workspace_id"] == "demo-workspace"
+
+
+def test_ingest_batch_broadcasts_events_in_order():
+    client = TestClient(create_app())
+    events = [
+        {"metric": "revenue", "timestamp": f"2024-01-01T0{hour}:00:00Z", "value": float(hour)}
+        for hour in range(3)
+    ]
+    with client.websocket_connect("/ws/demo-token") as websocket:
+        response = client.post("/ingest/batch", json={"token": "demo-token", "events": events})
+        assert response.status_code == 202
+        values = [websocket.receive_json()["value"] for _ in events]
+
+    assert values == [0.0, 1.0, 2.0]
+
+
+def test_broadcast_drops_stale_sockets_and_reaches_the_rest():
+    registry = WorkspaceRegistry()
+    healthy, closed = _FakeSocket(), _FakeSocket(RuntimeError("closed"))
+
+    async def scenario() -> None:
+        await registry.attach("ws", healthy)
+        await registry.attach("ws", closed)
+        await registry.broadcast("ws", {"metric": "revenue", "value": 1.0})
+        await registry.broadcast("ws", {"metric": "revenue", "value": 2.0})
+
+    asyncio.run(scenario())
+
+    assert [orjson.loads(item)["value"] for item in healthy.sent] == [1.0, 2.0]
+    assert registry._connections["ws"] == {healthy}
@@ -0,0 +1,38 @@
+"""Tests for the numba analytics kernels."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from backend.services._kernels import SEVERITY_HIGH, SEVERITY_MEDIUM, holt_damped_forecast, zscore_anomalies
+
+
+def test_zscore_anomalies_matches_numpy_reference():
+    rng = np.random.default_rng(7)
+    values = rng.normal(50, 5, 500)
+    values[[10, 200]] = [120.0, -40.0]
+    values[300] = np.nan
+
+    out_idx = np.empty(values.size, dtype=np.int64)
+    out_z = np.empty(values.size, dtype=np.float64)
+    out_sev = np.empty(values.size, dtype=np.int8)
+    count = zscore_anomalies(values, 3.0, out_idx, out_z, out_sev)
+
+    expected_z = (values - np.nanmean(values)) / np.nanstd(values)
+    expected_idx = np.flatnonzero(np.abs(expected_z) > 3.0)
+    assert out_idx[:count].tolist() == expected_idx.tolist()
+    assert out_z[:count] == pytest.approx(expected_z[expected_idx])
+    assert set(out_sev[:count].tolist()) <= {SEVERITY_MEDIUM, SEVERITY_HIGH}
+
+
+def test_zscore_anomalies_ignores_constant_series():
+    values = np.full(10, 3.5)
+    buffers = (np.empty(10, dtype=np.int64), np.empty(10), np.empty(10, dtype=np.int8))
+    assert zscore_anomalies(values, 1.0, *buffers) == 0
+
+
+def test_holt_damped_forecast_continues_linear_trend_without_damping():
+    values = np.arange(10, dtype=np.float64) * 2.0
+    forecast = holt_damped_forecast(values, np.array([0.5]), np.array([0.2]), 1.0, 3)
+    assert forecast == pytest.approx([20.0, 22.0, 24.0])
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pandas as pd
+import pytest
 
 from backend.services import DataPipelineService
 
@@ -22,3 +23,61 @@ def test_pipeline_clean_and_normalize():
 
     assert "drop_duplicates" in pipeline.summary()
     assert normalized.shape[0] == cleaned.shape[0]
+
+
+def test_pipeline_does_not_mutate_input():
+    frame = pd.DataFrame(
+        {
+            "value": [10.0, None, 40.0],
+            "category": ["A", None, "B"],
+        }
+    )
+    original = frame.copy()
+
+    pipeline = DataPipelineService()
+    cleaned = pipeline.clean(frame)
+    cleaned_snapshot = cleaned.copy()
+    pipeline.normalize(cleaned)
+
+    pd.testing.assert_frame_equal(frame, original)
+    pd.testing.assert_frame_equal(cleaned, cleaned_snapshot)
+
+
+def test_normalize_standardizes_numeric_columns():
+    frame = pd.DataFrame({"a": [1, 2, 3, 4], "constant": [5.0, 5.0, 5.0, 5.0]})
+    normalized = DataPipelineService().normalize(frame)
+    assert normalized["a"].mean() == pytest.approx(0.0)
+    assert normalized["a"].std(ddof=0) == pytest.approx(1.0)
+    assert normalized["constant"].tolist() == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_clean_parses_only_year_first_date_columns():
+    frame = pd.DataFrame(
+        {
+            "iso": ["2024-01-01", "2024-01-02T06:30:00", None, "2024-01-04"],
+            "slashed": ["2024/01/01", "2024/01/02", "2024/01/03", "2024/01/04"],
+            "mostly_text": ["2024-01-01", "n/a", "unknown", "2024-01-04"],
+            "name": ["alpha", "beta", "gamma", "delta"],
+        }
+    )
+    pipeline = DataPipelineService()
+    cleaned = pipeline.clean(frame)
+
+    assert pd.api.types.is_datetime64_any_dtype(cleaned["iso"])
+    assert cleaned["iso"].iloc[1] == pd.Timestamp("2024-01-02 06:30:00")
+    assert pd.api.types.is_datetime64_any_dtype(cleaned["slashed"])
+    assert cleaned["mostly_text"].tolist() == frame["mostly_text"].tolist()
+    assert cleaned["name"].tolist() == frame["name"].tolist()
+    assert [step for step in pipeline.summary() if step.startswith("parse_datetime")] == [
+        "parse_datetime:iso",
+        "parse_datetime:slashed",
+    ]
+
+
+
+@pytest.mark.filterwarnings("error::pandas.errors.SettingWithCopyWarning")
+def test_clean_fills_gaps_after_dropping_duplicates():
+    frame = pd.DataFrame({"value": [1.0, 1.0, None, 4.0], "category": ["A", "A", None, "B"]})
+    cleaned = DataPipelineService().clean(frame)
+    assert cleaned["value"].tolist() == [1.0, 2.5, 4.0]
+    assert cleaned["category"].isna().sum() == 0
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from backend.utils import build_connection_url
+import pandas as pd
+import pytest
+
+from backend.utils import build_connection_url, isoformat_values
 
 
 def test_build_connection_url_encodes_credentials():
@@ -18,3 +21,30 @@ def test_build_connection_url_encodes_credentials():
     assert "user+name" in url
     assert "p%40ss+word" in url
     assert url.endswith("charset=utf8mb4")
+
+
+def test_build_connection_url_keeps_plain_values_and_encodes_options():
+    url = build_connection_url(
+        driver="postgresql",
+        username="analyst",
+        password="secret42",
+        host="db",
+        port=5432,
+        database="sales",
+        options={"sslmode": "require", "application_name": "forecast alpha"},
+    )
+    assert url == (
+        "postgresql://analyst:secret42@db:5432/sales"
+        "?sslmode=require&application_name=forecast+alpha"
+    )
+
+
+@pytest.mark.parametrize("unit", ["us", "ns"])
+@pytest.mark.parametrize(
+    ("tz", "expected"),
+    [(None, "2024-01-05T00:00:00"), ("UTC", "2024-01-05T00:00:00+00:00")],
+)
+def test_isoformat_values_formats_arrow_timestamps(unit, tz, expected):
+    pa = pytest.importorskip("pyarrow")
+    values = pd.Series(pd.to_datetime(["2024-01-05"])).astype(pd.ArrowDtype(pa.timestamp(unit, tz=tz)))
+    assert isoformat_values(values).tolist() == [expected]